@@ -1,4 +1,6 @@
+from .snmp_utilities import AsyncSnmpUtility
 from .snmp_utilities import SnmpQuery
 from .snmp_utilities import SnmpUtility
+from .snmp_utilities import clear_session_cache
 
-__all__ = ['SnmpQuery', 'SnmpUtility', ]
+__all__ = ['AsyncSnmpUtility', 'SnmpQuery', 'SnmpUtility', 'clear_session_cache', ]
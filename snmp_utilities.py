@@ -10,13 +10,131 @@
 # This module allows access to classes which provide SNMP
 # querying functionality using the EasySNMP library.
 #
+# AsyncSnmpUtility exposes the same queries to asyncio code, the
+# blocking EasySNMP calls are run in worker threads so that many
+# devices can be polled concurrently.
+#
 # Required libraries:
 #   - easysnmp
 #       - https://github.com/fgimian/easysnmp
 #
 
 
-from easysnmp import Session
+import array
+import asyncio
+import collections
+import concurrent.futures
+import functools
+import threading
+import time
+
+from easysnmp import EasySNMPError, Session
+
+
+## @var _INTEGER_TYPES
+# @brief FROZENSET - EasySNMP types whose values are always integers
+_INTEGER_TYPES = frozenset((
+    'INTEGER', 'INTEGER32', 'UINTEGER', 'UNSIGNED32', 'COUNTER',
+    'COUNTER64', 'GAUGE', 'TICKS'
+))
+
+
+## @var MAX_CONCURRENCY
+# @brief INTEGER - The most devices polled at the same time by poll_hosts() and poll_many(), and the number of threads running AsyncSnmpUtility queries
+MAX_CONCURRENCY = 64
+
+## @var _EXECUTOR
+# @brief OBJECT - Thread pool shared by every AsyncSnmpUtility in the process
+_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=MAX_CONCURRENCY, thread_name_prefix='snmp_utilities')
+
+## @var SESSION_CACHE_SIZE
+# @brief INTEGER - The most EasySNMP Sessions kept open by the session cache, each holds a UDP socket
+SESSION_CACHE_SIZE = 256
+
+## @var UTILITY_CACHE_SIZE
+# @brief INTEGER - The most SnmpUtility instances kept by poll_hosts() and poll_many(), each holds two sessions
+UTILITY_CACHE_SIZE = 128
+
+
+@functools.lru_cache(maxsize=SESSION_CACHE_SIZE)
+def _get_session(host, snmp_version, community_string, use_numeric=False):
+    """! @brief Get the EasySNMP Session for a device
+
+    @param host STRING - The name of the host to perform the SNMP query on
+    @param snmp_version INTEGER - The SNMP version to use 1 or 2
+    @param community_string STRING - The SNMP 1 / v2c community string
+    @param use_numeric BOOLEAN - Return numeric OIDs instead of translating them with the MIBs
+    @return TUPLE - Instance of EasySNMP Session and the threading.Lock guarding it
+    @details
+
+    Sessions are shared by every SnmpQuery created for the same device so
+    the socket and net-snmp session state are set up once per process.
+    net-snmp sessions must not be used by more than one thread at a time,
+    the returned lock must be held around every request on the session.
+
+    A session stays open while it is in the cache or used by an
+    SnmpQuery.  The least recently used session is dropped once
+    SESSION_CACHE_SIZE are cached, clear_session_cache() drops them all.
+    """
+
+    session = Session(host, snmp_version, community_string,
+                      use_numeric=use_numeric)
+
+    return session, threading.Lock()
+
+
+@functools.lru_cache(maxsize=UTILITY_CACHE_SIZE)
+def _get_utility(utility_class, host, community_string, snmp_version):
+    """! @brief Get the SnmpUtility used to poll a device
+
+    @param utility_class CLASS - SnmpUtility or a subclass of it
+    @param host STRING - The name of the host to perform the SNMP query on
+    @param community_string STRING - The SNMP 1 / v2c community string
+    @param snmp_version INTEGER - The SNMP version to use 1 or 2
+    @return OBJECT - Instance of utility_class
+    @details
+
+    Reusing the instance between polling rounds keeps its cached
+    interface OIDs, so only the first round walks the interface tables.
+    The least recently used instance is dropped once UTILITY_CACHE_SIZE
+    are cached, so together with the session cache at most
+    SESSION_CACHE_SIZE + 2 * UTILITY_CACHE_SIZE sessions are kept open.
+    """
+
+    return utility_class(host, community_string, snmp_version)
+
+
+def clear_session_cache():
+    """! @brief Drop every cached EasySNMP Session and SnmpUtility
+
+    @details
+
+    Sessions and the SnmpUtility instances used by poll_hosts() and
+    poll_many() are kept for the life of the process so their sockets
+    and cached interface OIDs can be reused.  Call this function when
+    the list of polled devices changes, each session's socket is closed
+    once no SnmpQuery created before the call still uses it.
+    """
+
+    _get_utility.cache_clear()
+    _get_session.cache_clear()
+
+
+async def _run_blocking(func, *args):
+    """! @brief Run a blocking EasySNMP call in the shared thread pool
+
+    @param func FUNCTION - The function to call
+    @param args TUPLE - Arguments to pass to func
+    @return MIXED - The value returned by func
+    @details
+
+    The event loop's default executor is limited to a few threads per CPU,
+    which would cap the number of devices polled concurrently.
+    """
+
+    return await asyncio.get_running_loop().run_in_executor(
+        _EXECUTOR, func, *args)
 
 
 class SnmpQuery:
@@ -34,8 +152,8 @@ class SnmpQuery:
         @exception NotImplementedError Triggered if SNMP v3 is attempted
         @details
 
-        SnmpQuery class constructor, stores parameters and instantiates a new
-        instance of EasySNMP Session.
+        SnmpQuery class constructor, stores parameters and retrieves the
+        EasySNMP Session for the device, creating it on first use.
         """
 
         if snmp_version == 1 or snmp_version == 2:
@@ -49,11 +167,19 @@ class SnmpQuery:
             # @brief STRING - The SNMP community string set on the device
             self.community_string = community_string
 
-            ## @var snmp
-            # @brief OBJECT - Instance of EasySNMP Session
-            self.snmp = Session(host, snmp_version, community_string)
+            ## @var snmp_version
+            # @brief INTEGER - The SNMP version used to query the device
+            self.snmp_version = snmp_version
 
-        if snmp_version == 3:
+            ## @var snmp
+            # @brief OBJECT - Instance of EasySNMP Session, shared by all queries to this device
+            #
+            ## @var snmp_lock
+            # @brief OBJECT - threading.Lock held around every request made with snmp
+            self.snmp, self.snmp_lock = _get_session(
+                host, snmp_version, community_string)
+
+        elif snmp_version == 3:
             raise NotImplementedError
 
     def bulkwalk(self, oids):
@@ -66,48 +192,46 @@ class SnmpQuery:
         Performs an SNMP GETBULK operation and passes the results to parse()
         """
 
-        fetched_results = {}  # Blank dictionary to hold fields
-
-        for oid in oids:
-            # OIDS must be fed to bulkwalk one at a time
-
-            fields = self.snmp.bulkwalk(oid)
-
-            for field in fields:
-                if str(field.oid_index) not in fetched_results:
-                    fetched_results[str(field.oid_index)] = {
-                        str(field.oid): self.cast(field.value)
-                    }
-                else:
-                    fetched_results[str(field.oid_index)].update(
-                        {field.oid: self.cast(field.value)})
-
-        return self.parse(fetched_results)
+        return self.parse(self.group_by_index(self.walk(oids)))
 
-    def cast(self, value):
+    def cast(self, value, snmp_type=None):
         """! @brief Correctly set the type of the given variable
 
         @param value - MIXED The value to be cast
+        @param snmp_type STRING - Optional EasySNMP type of the value, e.g. INTEGER, COUNTER64 or OCTETSTR
         @return MIXED The value correctly cast to it's type
         @details
 
-        Attempts to cast value as and integer, float then string.
-        if a ValueError or TypeError occurs the next attempt it made.
-        If the value cannot be cast as any of the types it is returned
-        as is.
+        Values of the SNMP integer types are cast directly to integers.
+        Other values are cast as an integer, float then string, as int()
+        and float() would; strings are only handed to int() and float()
+        when their first non blank character can start a number, so that
+        no exceptions are raised for the common case of a non numeric
+        string.
         """
+
+        if snmp_type in _INTEGER_TYPES:
+            return int(value)
+
+        if isinstance(value, str):
+            first = value.lstrip()[:1]
+
+            if first in ('n', 'N', 'i', 'I'):
+                try:
+                    return float(value)
+                except ValueError:
+                    return value
+
+            if not (first.isdigit() or first in ('+', '-', '.')):
+                return value
+
         try:
             return int(value)
         except (ValueError, TypeError):
             try:
                 return float(value)
             except (ValueError, TypeError):
-                try:
-                    return str(value)
-                except (ValueError, TypeError):
-                    pass
-
-        return value
+                return str(value)
 
     def get(self, oids):
         """! @brief Perform SNMP GET operation
@@ -116,7 +240,7 @@ class SnmpQuery:
         @return DICTIONARY - Dictionary containing the result
         @details
 
-        Performs an SNMP GET operation and passes the result to parse().
+        Performs an SNMP GET operation and passes the results to parse().
 
         The variable results will contain a list of SNMPVariable objects
         if multiple OIDs were passed.  In this case the method will generate
@@ -128,28 +252,35 @@ class SnmpQuery:
         dictionary with the OID and OID value pair
         """
 
-        results = self.snmp.get(oids)
+        with self.snmp_lock:
+            results = self.snmp.get(oids)
+
+        if not isinstance(results, list):
+            # A single OID was returned, parse() would return it unchanged
+            return {results.oid: self.cast(results.value, results.snmp_type)}
 
-        fetched_results = {}  # Define blank dictionary to hold results
+        # Multiple OIDs were returned
+        return self.parse(self.group_by_index(results))
 
-        if type(results) is list:
-            # Multiple OIDs were returned
+    def group_by_index(self, fields, names=None):
+        """! @brief Group SNMP fields by their OID index
 
-            for result in results:
-                if str(result.oid_index) not in fetched_results:
-                    fetched_results[str(result.oid_index)] = {
-                        str(result.oid): self.cast(result.value)
-                    }
-                else:
-                    fetched_results[str(result.oid_index)].update(
-                        {result.oid: self.cast(result.value)})
-        else:
-            # A single OID was returned
-            fetched_results = {
-                results.oid: self.cast(results.value)
-            }
+        @param fields LIST - List of EasySNMP SNMPVariable objects
+        @param names DICTIONARY - Optional field name to use in place of each OID
+        @return DICTIONARY - Dict of dicts containing the cast SNMP fields organised by field index
+        """
 
-        return self.parse(fetched_results)
+        # Blank dictionary of dictionaries to hold fields
+        fetched_results = collections.defaultdict(dict)
+
+        for field in fields:
+            # EasySNMP already provides the OID and index as strings
+            oid = field.oid if names is None else names.get(field.oid,
+                                                            field.oid)
+            fetched_results[field.oid_index][oid] = self.cast(
+                field.value, field.snmp_type)
+
+        return dict(fetched_results)
 
     def parse(self, snmp_results):
         """! @brief Parse SNMP results
@@ -159,16 +290,29 @@ class SnmpQuery:
         @return DICTIONARY Returns a dictionary if only a single result is passed in snmp_results
         """
 
-        # Process the results into a list of dictionaries
-        result_list = []
-
         if len(snmp_results) == 1:
             return snmp_results
 
-        for index, stats_list in snmp_results.items():
-            result_list.append(stats_list)
+        # Process the results into a list of dictionaries
+        return list(snmp_results.values())
 
-        return result_list
+    def walk(self, oids):
+        """! @brief Fetch the raw fields below the given OIDs via SNMP GETBULK
+
+        @param oids LIST - List of OIDs, or textual names to query
+        @return LIST - List of EasySNMP SNMPVariable objects
+        """
+
+        fields = []  # Blank list to hold the returned fields
+
+        with self.snmp_lock:
+            for oid in oids:
+                # EasySNMP walks a list of OIDs one OID at a time and marks
+                # list support as experimental, so OIDs are fed to
+                # bulkwalk one at a time
+                fields.extend(self.snmp.bulkwalk(oid))
+
+        return fields
 
 
 class SnmpUtility(SnmpQuery):
@@ -180,10 +324,38 @@ class SnmpUtility(SnmpQuery):
     from SNMP enabled devices.
     """
 
-    def __init__(self, *args):
+    ## @var interface_oids
+    # @brief DICTIONARY - Numeric OID and IF-MIB name of the interface fields fetched by get_snmp_interfaces()
+    interface_oids = {
+        '.1.3.6.1.2.1.2.2.1.1': 'ifIndex',
+        '.1.3.6.1.2.1.31.1.1.1.1': 'ifName',
+        '.1.3.6.1.2.1.2.2.1.3': 'ifType',
+        '.1.3.6.1.2.1.2.2.1.7': 'ifAdminStatus',
+        '.1.3.6.1.2.1.2.2.1.8': 'ifOperStatus',
+        '.1.3.6.1.2.1.31.1.1.1.6': 'ifHCInOctets',
+        '.1.3.6.1.2.1.31.1.1.1.7': 'ifHCInUcastPkts',
+        '.1.3.6.1.2.1.31.1.1.1.8': 'ifHCInMulticastPkts',
+        '.1.3.6.1.2.1.31.1.1.1.9': 'ifHCInBroadcastPkts',
+        '.1.3.6.1.2.1.31.1.1.1.10': 'ifHCOutOctets',
+        '.1.3.6.1.2.1.31.1.1.1.11': 'ifHCOutUcastPkts',
+        '.1.3.6.1.2.1.31.1.1.1.12': 'ifHCOutMulticastPkts',
+        '.1.3.6.1.2.1.31.1.1.1.13': 'ifHCOutBroadcastPkts',
+        '.1.3.6.1.2.1.2.2.1.13': 'ifInDiscards',
+        '.1.3.6.1.2.1.2.2.1.14': 'ifInErrors',
+        '.1.3.6.1.2.1.2.2.1.15': 'ifInUnknownProtos',
+        '.1.3.6.1.2.1.2.2.1.19': 'ifOutDiscards',
+        '.1.3.6.1.2.1.2.2.1.20': 'ifOutErrors'
+    }
+
+    ## @var max_get_oids
+    # @brief INTEGER - The maximum number of OIDs requested in a single SNMP GET
+    max_get_oids = 32
+
+    def __init__(self, *args, refresh_oids_cache_interval=3600):
         """! @brief Constructor
 
         @param args TUPLE - Arguments to pass to the parent constructor, hostname and community string
+        @param refresh_oids_cache_interval INTEGER - Seconds before the cached interface OIDs are discovered again
         @details
 
         Passes the SNMP device hostname and community string to the parent constructor
@@ -191,9 +363,130 @@ class SnmpUtility(SnmpQuery):
 
         super().__init__(*args)
 
-    def get_snmp_interfaces(self):
+        ## @var interface_snmp
+        # @brief OBJECT - Instance of EasySNMP Session returning numeric OIDs, only used to GET the cached interface OIDs
+        #
+        ## @var interface_snmp_lock
+        # @brief OBJECT - threading.Lock held around every request made with interface_snmp
+        self.interface_snmp, self.interface_snmp_lock = _get_session(
+            self.host, self.snmp_version, self.community_string,
+            use_numeric=True)
+
+        ## @var refresh_oids_cache_interval
+        # @brief INTEGER - Seconds before the cached interface OIDs are discovered again
+        self.refresh_oids_cache_interval = refresh_oids_cache_interval
+
+        ## @var _oid_cache
+        # @brief DICTIONARY - Concrete interface OIDs organised by interface index
+        self._oid_cache = {}
+
+        ## @var _flat_oids
+        # @brief LIST - The OIDs in _oid_cache flattened into a single list
+        self._flat_oids = []
+
+        ## @var _cache_ts
+        # @brief FLOAT - Monotonic time at which _oid_cache was populated
+        self._cache_ts = 0.0
+
+        ## @var _cache_lock
+        # @brief OBJECT - threading.RLock held while the cached OIDs or device name are used or updated
+        self._cache_lock = threading.RLock()
+
+        ## @var _host_name
+        # @brief DICTIONARY - The cached result of get_snmp_name()
+        self._host_name = None
+
+        ## @var _host_name_ts
+        # @brief FLOAT - Monotonic time at which _host_name was fetched
+        self._host_name_ts = 0.0
+
+    @functools.cached_property
+    def interface_names(self):
+        """! @brief Field name of each interface OID
+
+        @return DICTIONARY - Name of each OID in interface_oids, looked up with and without the leading dot
+        @details
+
+        Built from the instance's interface_oids on first use, so fields
+        added by a subclass are named as well.
+        """
+
+        interface_oids = self.interface_oids
+
+        return dict(interface_oids, **{
+            oid.lstrip('.'): name for oid, name in interface_oids.items()})
+
+    @functools.cached_property
+    def interface_numeric_oids(self):
+        """! @brief Numeric OID of each interface field
+
+        @return DICTIONARY - Numeric OID in interface_oids for each field name, and for each OID with or without the leading dot
+        @details
+
+        Built from the instance's interface_oids on first use, so fields
+        added by a subclass are included as well.
+        """
+
+        interface_oids = self.interface_oids
+
+        return dict(
+            {name: oid for oid, name in interface_oids.items()},
+            **{oid.lstrip('.'): oid for oid in interface_oids},
+            **{oid: oid for oid in interface_oids})
+
+    @classmethod
+    def poll_hosts(cls, hosts, community_string, snmp_version,
+                   workers=MAX_CONCURRENCY):
+        """! @brief Get interface statistics from many SNMP devices concurrently
+
+        @param hosts LIST - The names of the hosts to poll
+        @param community_string STRING - The SNMP 1 / v2c community string
+        @param snmp_version INTEGER - The SNMP version to use 1 or 2
+        @param workers INTEGER - The maximum number of devices polled at the same time, at most MAX_CONCURRENCY
+        @return DICTIONARY - Interface statistics, or the exception raised while polling, keyed by host
+        @exception ValueError Triggered if workers is not between 1 and MAX_CONCURRENCY
+        @details
+
+        Each host is polled by get_snmp_interfaces() in a thread pool, the
+        threads spend most of their time waiting for the devices to
+        respond.  The SnmpUtility for each host is kept between calls so
+        its cached interface OIDs are reused.  Each SnmpUtility locks its
+        cache while polling, so overlapping calls for the same host wait
+        for each other.  Duplicate hosts are polled once.
+
+        workers is limited to MAX_CONCURRENCY, the same limit as
+        AsyncSnmpUtility.poll_many(), and a higher value is rejected
+        rather than silently capped.
+        """
+
+        if not 1 <= workers <= MAX_CONCURRENCY:
+            raise ValueError(
+                'workers must be between 1 and {}'.format(MAX_CONCURRENCY))
+
+        def poll(host):
+            return _get_utility(cls, host, community_string,
+                                snmp_version).get_snmp_interfaces()
+
+        hosts = list(dict.fromkeys(hosts))  # Remove duplicate hosts
+        results = {}  # Blank dictionary to hold the results
+
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=max(1, min(workers, len(hosts)))) as executor:
+            futures = {executor.submit(poll, host): host for host in hosts}
+
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    results[futures[future]] = future.result()
+                except Exception as error:
+                    results[futures[future]] = error
+
+        return results
+
+    def get_snmp_interfaces(self, brief=True):
         """! @brief Get interface statistics via SNMP
 
+        @param brief BOOLEAN - Key the fields by IF-MIB name, or by numeric OID if False
+        @return LIST of DICTIONARIES - Interface statistics, one list entry per interface
         @details
 
         Gets statistics for network interfaces, the following fields
@@ -218,43 +511,184 @@ class SnmpUtility(SnmpQuery):
           - IF-MIB::ifOutDiscards
           - IF-MIB::ifOutErrors
 
+        The interface OIDs found by the first walk are cached, subsequent
+        calls fetch them with SNMP GET until refresh_oids_cache_interval
+        seconds have passed.  The cached OIDs are requested by numeric OID
+        so net-snmp does not translate every returned OID with the MIBs.
+
         The information is returned as a list of dictionaries
         """
 
-        oids = [
-            'IF-MIB::ifIndex',
-            'IF-MIB::ifName',
-            'IF-MIB::ifType',
-            'IF-MIB::ifAdminStatus',
-            'IF-MIB::ifOperStatus',
-            'IF-MIB::ifHCInOctets',
-            'IF-MIB::ifHCInUcastPkts',
-            'IF-MIB::ifHCInMulticastPkts',
-            'IF-MIB::ifHCInBroadcastPkts',
-            'IF-MIB::ifHCOutOctets',
-            'IF-MIB::ifHCOutUcastPkts',
-            'IF-MIB::ifHCOutMulticastPkts',
-            'IF-MIB::ifHCOutBroadcastPkts',
-            'IF-MIB::ifInDiscards',
-            'IF-MIB::ifInErrors',
-            'IF-MIB::ifInUnknownProtos',
-            'IF-MIB::ifOutDiscards',
-            'IF-MIB::ifOutErrors'
-        ]
-
-        interface_stats = self.bulkwalk(oids)
+        interface_stats = self.parse(self.group_by_index(
+            self.get_interface_fields(),
+            self.interface_names if brief else self.interface_numeric_oids))
 
         return interface_stats  # Return out the gathered statistics
 
+    def get_snmp_interface_columns(self, brief=True):
+        """! @brief Get interface statistics via SNMP organised by column
+
+        @param brief BOOLEAN - Key the columns by IF-MIB name, or by numeric OID if False
+        @return DICTIONARY - Dictionary of field name and column of values, one entry per interface
+        @details
+
+        Gets the same fields as get_snmp_interfaces() without building a
+        dictionary for every interface.  Every column lists the interfaces
+        in the same order.  Integer fields returned by every interface are
+        array.array columns ('q' for signed and 'Q' for unsigned SNMP
+        types).  All other fields are lists, and a value missing from the
+        device is None so it cannot be mistaken for a zero counter.
+        """
+
+        fields = self.get_interface_fields()
+
+        # Position of each interface index in the columns
+        positions = {index: position for position, index in enumerate(
+            dict.fromkeys(field.oid_index for field in fields))}
+
+        columns = {}  # Blank dictionary to hold the columns
+        typecodes = {}  # Array typecode of each integer column
+
+        for field in fields:
+            column = columns.get(field.oid)
+
+            if column is None:
+                column = columns[field.oid] = [None] * len(positions)
+
+                if field.snmp_type in _INTEGER_TYPES:
+                    typecodes[field.oid] = 'q' if field.snmp_type in (
+                        'INTEGER', 'INTEGER32') else 'Q'
+
+            column[positions[field.oid_index]] = self.cast(
+                field.value, field.snmp_type)
+
+        for oid, typecode in typecodes.items():
+            if None not in columns[oid]:
+                # Every interface returned the field, store it compactly
+                columns[oid] = array.array(typecode, columns[oid])
+
+        names = self.interface_names if brief else self.interface_numeric_oids
+
+        return {names.get(oid, oid): column for oid, column in columns.items()}
+
+    def get_interface_fields(self):
+        """! @brief Get the raw interface fields via SNMP
+
+        @return LIST - List of EasySNMP SNMPVariable objects
+        @details
+
+        Fetches the cached interface OIDs with SNMP GET while the cache is
+        valid, otherwise walks the interface tables and caches the OIDs
+        that were found.  The cache is locked for the whole call, so
+        threads sharing this instance poll the device one at a time.
+
+        The walk uses the textual session.  EasySNMP switches net-snmp's
+        process-wide OID output format for the whole of a numeric
+        bulkwalk while releasing the GIL, which would corrupt requests
+        made by other threads at the same time.  The numeric session is
+        only used for the cached GETs, which set and restore the format
+        while holding the GIL.
+        """
+
+        with self._cache_lock:
+            if self._oid_cache and (time.monotonic() - self._cache_ts
+                                    < self.refresh_oids_cache_interval):
+                # Interface OIDs are known, fetch them directly with SNMP GET
+                fields = self.get_cached_interface_fields()
+
+                if fields is not None:
+                    return fields
+
+            fields = self.walk(self.interface_oids)
+
+            numeric_oids = self.interface_numeric_oids
+            oid_cache = {}  # Blank dictionary to hold the discovered OIDs
+
+            for field in fields:
+                # Cache the numeric OID for the numeric session to GET
+                numeric_oid = numeric_oids.get(field.oid, field.oid)
+                oid_cache.setdefault(field.oid_index, []).append(
+                    '{}.{}'.format(numeric_oid, field.oid_index))
+
+            self._oid_cache = oid_cache
+            self._flat_oids = [
+                oid for oids in oid_cache.values() for oid in oids]
+            self._cache_ts = time.monotonic()
+
+            return fields
+
+    def get_cached_interface_fields(self):
+        """! @brief Get the raw interface fields for the cached interface OIDs
+
+        @return LIST - List of EasySNMP SNMPVariable objects, or None if the cache was invalidated
+        @details
+
+        Requests every OID discovered by the last interface walk with
+        SNMP GET, which avoids walking the interface tables again.  If the
+        device returns missing instances or an unexpected number of
+        fields, for example when an interface has been removed, the cache
+        is invalidated and None is returned so the interfaces are walked
+        again.  If the GET fails, for example with a timeout, the cache is
+        invalidated and the error is raised rather than walking an
+        unreachable device.
+        """
+
+        with self._cache_lock:
+            flat_oids = self._flat_oids
+
+            fields = []  # Blank list to hold the returned fields
+
+            try:
+                with self.interface_snmp_lock:
+                    for start in range(0, len(flat_oids), self.max_get_oids):
+                        fields.extend(
+                            self.interface_snmp.get(
+                                flat_oids[start:start + self.max_get_oids]))
+            except EasySNMPError:
+                self.clear_oid_cache()
+                raise
+
+            if len(fields) != len(flat_oids) or any(
+                    field.snmp_type in ('NOSUCHOBJECT', 'NOSUCHINSTANCE')
+                    for field in fields):
+                # The interfaces have changed, rediscover them with a new walk
+                self.clear_oid_cache()
+                return None
+
+            return fields
+
+    def clear_oid_cache(self):
+        """! @brief Discard the cached interface OIDs
+
+        @details
+
+        The next call to get_snmp_interfaces() walks the interface tables
+        again.
+        """
+
+        with self._cache_lock:
+            self._oid_cache = {}
+            self._flat_oids = []
+            self._cache_ts = 0.0
+
     def get_snmp_name(self):
         """! @brief Get the name of an SNMP device
 
         @return DICTIONARY - Dictionary containing the value of SNMPv2-MIB::sysName.0
+        @details
+
+        The name rarely changes so it is only fetched again once
+        refresh_oids_cache_interval seconds have passed.
         """
 
-        host_name = self.get('SNMPv2-MIB::sysName.0')
+        with self._cache_lock:
+            if self._host_name is None or (
+                    time.monotonic() - self._host_name_ts
+                    >= self.refresh_oids_cache_interval):
+                self._host_name = self.get('SNMPv2-MIB::sysName.0')
+                self._host_name_ts = time.monotonic()
 
-        return host_name
+            return dict(self._host_name)
 
     def get_snmp_uptime(self):
         """! @brief Get the uptime from an SNMP enabled device
@@ -265,3 +699,119 @@ class SnmpUtility(SnmpQuery):
         host_uptime = self.get('DISMAN-EVENT-MIB::sysUpTimeInstance')
 
         return host_uptime
+
+
+class AsyncSnmpUtility:
+    """! @brief Asynchronous SNMP utility class
+
+    @details
+
+    This class provides the methods of SnmpUtility as coroutines so that
+    many SNMP devices can be polled concurrently from an asyncio event loop.
+    EasySNMP is a blocking library, each query is run in a thread pool
+    shared by every instance in the process.
+
+    Instances are created with the create() coroutine, which opens the
+    EasySNMP sessions without blocking the event loop.
+    """
+
+    def __init__(self, utility):
+        """! @brief Constructor
+
+        @param utility OBJECT - Instance of SnmpUtility, or a subclass of it, used to perform the queries
+        @details
+
+        Use create() to build the SnmpUtility in the thread pool, as
+        opening its EasySNMP sessions resolves the host name.
+        """
+
+        ## @var utility
+        # @brief OBJECT - Instance of SnmpUtility used to perform the queries
+        self.utility = utility
+
+    @classmethod
+    async def create(cls, *args, utility_class=SnmpUtility, **kwargs):
+        """! @brief Create an AsyncSnmpUtility without blocking the event loop
+
+        @param args TUPLE - Arguments to pass to the SnmpUtility constructor, hostname, community string and SNMP version
+        @param utility_class CLASS - SnmpUtility or a subclass of it
+        @param kwargs DICTIONARY - Keyword arguments to pass to the SnmpUtility constructor
+        @return OBJECT - Instance of AsyncSnmpUtility
+        """
+
+        utility = await _run_blocking(
+            functools.partial(utility_class, *args, **kwargs))
+
+        return cls(utility)
+
+    async def get_snmp_interfaces(self, brief=True):
+        """! @brief Get interface statistics via SNMP
+
+        @param brief BOOLEAN - Key the fields by IF-MIB name, or by numeric OID if False
+        @return LIST of DICTIONARIES - See SnmpUtility::get_snmp_interfaces()
+        """
+
+        return await _run_blocking(self.utility.get_snmp_interfaces, brief)
+
+    async def get_snmp_name(self):
+        """! @brief Get the name of an SNMP device
+
+        @return DICTIONARY - See SnmpUtility::get_snmp_name()
+        """
+
+        return await _run_blocking(self.utility.get_snmp_name)
+
+    async def get_snmp_uptime(self):
+        """! @brief Get the uptime from an SNMP enabled device
+
+        @return DICTIONARY - See SnmpUtility::get_snmp_uptime()
+        """
+
+        return await _run_blocking(self.utility.get_snmp_uptime)
+
+    @classmethod
+    async def poll_many(cls, hosts, community_string, snmp_version,
+                        max_concurrency=MAX_CONCURRENCY,
+                        utility_class=SnmpUtility):
+        """! @brief Get interface statistics from many SNMP devices concurrently
+
+        @param hosts LIST - The names of the hosts to poll
+        @param community_string STRING - The SNMP 1 / v2c community string
+        @param snmp_version INTEGER - The SNMP version to use 1 or 2
+        @param max_concurrency INTEGER - The maximum number of devices polled at the same time, at most MAX_CONCURRENCY
+        @param utility_class CLASS - SnmpUtility or a subclass of it used to poll each host
+        @return LIST - Interface statistics for each host in the order given, or the exception raised while polling it
+        @exception ValueError Triggered if max_concurrency is not between 1 and MAX_CONCURRENCY
+        @details
+
+        The SnmpUtility for each host is kept between calls so its cached
+        interface OIDs are reused, and is shared with poll_hosts().  Each
+        SnmpUtility locks its cache while polling, so overlapping calls for
+        the same host wait for each other.  Duplicate hosts are polled once.
+
+        Queries run in a thread pool of MAX_CONCURRENCY threads shared by
+        the whole process, so a higher max_concurrency is rejected rather
+        than silently capped.
+        """
+
+        if not 1 <= max_concurrency <= MAX_CONCURRENCY:
+            raise ValueError(
+                'max_concurrency must be between 1 and {}'.format(
+                    MAX_CONCURRENCY))
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def poll(host):
+            async with semaphore:
+                utility = await _run_blocking(
+                    _get_utility, utility_class, host, community_string,
+                    snmp_version)
+
+                return await _run_blocking(utility.get_snmp_interfaces)
+
+        unique_hosts = list(dict.fromkeys(hosts))  # Remove duplicate hosts
+
+        results = dict(zip(unique_hosts, await asyncio.gather(
+            *(poll(host) for host in unique_hosts), return_exceptions=True)))
+
+        return [results[host] for host in hosts]
@@ -0,0 +1,456 @@
+import asyncio
+import math
+import os
+import sys
+import threading
+import types
+
+import pytest
+
+try:
+    import easysnmp
+except ImportError:
+    # EasySNMP needs the net-snmp headers to build, the tests only need
+    # its exception classes as every Session is replaced by FakeSession
+    easysnmp = types.ModuleType('easysnmp')
+
+    class EasySNMPError(Exception):
+        pass
+
+    class EasySNMPTimeoutError(EasySNMPError):
+        pass
+
+    easysnmp.EasySNMPError = EasySNMPError
+    easysnmp.EasySNMPTimeoutError = EasySNMPTimeoutError
+    easysnmp.Session = None
+    sys.modules['easysnmp'] = easysnmp
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import snmp_utilities  # noqa: E402
+
+# Name of every numeric OID the fake devices answer
+NAMES = dict(snmp_utilities.SnmpUtility.interface_oids, **{
+    '.1.3.6.1.2.1.31.1.1.1.18': 'ifAlias',
+    '.1.3.6.1.2.1.1.5': 'sysName'})
+NUMERIC_OIDS = {name: oid for oid, name in NAMES.items()}
+
+# net-snmp's process-wide OID output format, see FakeSession
+OUTPUT_FORMAT = {'numeric': False}
+
+
+class FakeVariable:
+    def __init__(self, oid, oid_index, value, snmp_type):
+        self.oid = oid
+        self.oid_index = oid_index
+        self.value = value
+        self.snmp_type = snmp_type
+
+
+class FakeDevice:
+    """State shared by every session opened to the same host"""
+
+    def __init__(self):
+        self.indexes = ['1', '2']
+        self.calls = []
+
+
+class FakeSession:
+    """Answers every OID in NAMES for the device's indexes
+
+    Like EasySNMP 0.2.6, a numeric session switches the process-wide
+    output format to numeric for the whole of a bulkwalk, calling
+    self.hook while other threads may run, and only while building the
+    response of a get.  Fields are formatted with the current format, a
+    numeric session reading a textual OID returns empty names.
+    """
+
+    devices = {}
+
+    def __init__(self, host, snmp_version, community_string,
+                 use_numeric=False, **kwargs):
+        self.device = self.devices.setdefault(host, FakeDevice())
+        self.use_numeric = use_numeric
+        self.calls = self.device.calls
+        self.get_error = None
+        self.drop_get_results = 0
+        self.lock = None
+        self.locked = []
+        self.hook = None
+
+    def variable(self, oid, index):
+        oid = oid.split('::')[-1]
+        numeric_oid = NUMERIC_OIDS.get(oid, oid)
+        name = NAMES[numeric_oid if numeric_oid.startswith('.')
+                     else '.' + numeric_oid]
+
+        if OUTPUT_FORMAT['numeric']:
+            oid = numeric_oid
+        elif self.use_numeric:
+            oid = index = ''
+        else:
+            oid = name
+
+        if name == 'sysName':
+            return FakeVariable(oid, index, 'switch', 'OCTETSTR')
+
+        if index not in self.device.indexes:
+            return FakeVariable(oid, index, 'NOSUCHINSTANCE', 'NOSUCHINSTANCE')
+
+        if name == 'ifName':
+            return FakeVariable(oid, index, 'eth' + index, 'OCTETSTR')
+
+        return FakeVariable(oid, index, str(int(index) * 10), 'COUNTER64')
+
+    def request(self, method):
+        self.calls.append(method)
+        self.locked.append(self.lock is not None and self.lock.locked())
+
+    def bulkwalk(self, oid):
+        self.request('bulkwalk')
+
+        if self.use_numeric:
+            OUTPUT_FORMAT['numeric'] = True
+
+        try:
+            if self.hook is not None:
+                self.hook()
+
+            return [self.variable(oid, index) for index in self.device.indexes]
+        finally:
+            if self.use_numeric:
+                OUTPUT_FORMAT['numeric'] = False
+
+    def get(self, oids):
+        self.request('get')
+
+        if self.hook is not None:
+            self.hook()
+
+        if self.get_error is not None:
+            raise self.get_error
+
+        if self.use_numeric:
+            OUTPUT_FORMAT['numeric'] = True
+
+        try:
+            if isinstance(oids, str):
+                return self.variable(*oids.rsplit('.', 1))
+
+            fields = [self.variable(*oid.rsplit('.', 1)) for oid in oids]
+        finally:
+            if self.use_numeric:
+                OUTPUT_FORMAT['numeric'] = False
+
+        return fields[:len(fields) - self.drop_get_results]
+
+
+def walk_count():
+    return len(snmp_utilities.SnmpUtility.interface_oids)
+
+
+@pytest.fixture
+def utility(monkeypatch):
+    monkeypatch.setattr(snmp_utilities, 'Session', FakeSession)
+    FakeSession.devices.clear()
+    OUTPUT_FORMAT['numeric'] = False
+    snmp_utilities._get_session.cache_clear()
+    snmp_utilities._get_utility.cache_clear()
+
+    utility = snmp_utilities._get_utility(
+        snmp_utilities.SnmpUtility, 'switch', 'public', 2)
+
+    yield utility
+
+    snmp_utilities._get_session.cache_clear()
+    snmp_utilities._get_utility.cache_clear()
+
+
+def test_warm_cache_uses_get(utility):
+    walked = utility.get_snmp_interfaces()
+    walked_calls = len(utility.snmp.calls)
+    cached = utility.get_snmp_interfaces()
+
+    assert cached == walked
+    assert walked[1]['ifName'] == 'eth2'
+    assert walked[1]['ifHCInOctets'] == 20
+    assert utility.snmp.calls[:walked_calls] == ['bulkwalk'] * walk_count()
+    assert 'bulkwalk' not in utility.snmp.calls[walked_calls:]
+
+
+def test_cache_holds_numeric_oids(utility):
+    utility.get_snmp_interfaces()
+
+    assert utility._oid_cache['2'][0] == '.1.3.6.1.2.1.2.2.1.1.2'
+    assert utility.get_snmp_interfaces(brief=False)[0][
+        '.1.3.6.1.2.1.2.2.1.1'] == 10
+
+
+def test_expired_cache_walks_again(utility):
+    utility.refresh_oids_cache_interval = 0
+
+    utility.get_snmp_interfaces()
+    utility.get_snmp_interfaces()
+
+    assert utility.snmp.calls == ['bulkwalk'] * walk_count() * 2
+
+
+def test_missing_instance_walks_again(utility):
+    utility.get_snmp_interfaces()
+    utility.snmp.device.indexes = ['1']
+
+    utility.get_snmp_interfaces()
+
+    assert utility.snmp.calls[-1] == 'bulkwalk'
+    assert list(utility._oid_cache) == ['1']
+
+
+def test_wrong_field_count_walks_again(utility):
+    utility.get_snmp_interfaces()
+    utility.interface_snmp.drop_get_results = 1
+
+    utility.get_snmp_interfaces()
+
+    assert utility.snmp.calls[-1] == 'bulkwalk'
+    assert list(utility._oid_cache) == ['1', '2']
+
+
+def test_error_clears_cache_and_raises(utility):
+    utility.get_snmp_interfaces()
+    utility.interface_snmp.get_error = easysnmp.EasySNMPTimeoutError('timeout')
+
+    with pytest.raises(easysnmp.EasySNMPTimeoutError):
+        utility.get_snmp_interfaces()
+
+    assert utility._oid_cache == {}
+    assert utility.snmp.calls.count('bulkwalk') == walk_count()
+
+
+def test_concurrent_walks_keep_textual_names(utility):
+    other = snmp_utilities._get_utility(
+        snmp_utilities.SnmpUtility, 'router', 'public', 2)
+    results = {}
+
+    def poll_router():
+        results['interfaces'] = other.get_snmp_interfaces()
+        results['name'] = other.get_snmp_name()
+
+    def walk_router_during_switch_walk():
+        utility.snmp.hook = utility.interface_snmp.hook = None
+        thread = threading.Thread(target=poll_router)
+        thread.start()
+        thread.join()
+
+    utility.snmp.hook = walk_router_during_switch_walk
+    utility.interface_snmp.hook = walk_router_during_switch_walk
+
+    interfaces = utility.get_snmp_interfaces()
+
+    for polled, cache in ((interfaces, utility._oid_cache),
+                          (results['interfaces'], other._oid_cache)):
+        assert polled[1]['ifName'] == 'eth2'
+        assert polled[1]['ifHCInOctets'] == 20
+        assert cache['2'][0] == '.1.3.6.1.2.1.2.2.1.1.2'
+
+    assert results['name'] == {'sysName': 'switch'}
+    assert utility.get_snmp_interfaces() == interfaces
+
+
+def test_sessions_are_shared_with_their_lock(utility):
+    other = snmp_utilities.SnmpUtility('switch', 'public', 2)
+
+    assert other.snmp is utility.snmp
+    assert other.snmp_lock is utility.snmp_lock
+    assert other.interface_snmp_lock is utility.interface_snmp_lock
+    assert utility.snmp_lock is not utility.interface_snmp_lock
+
+
+def test_requests_hold_the_session_lock(utility):
+    utility.snmp.lock = utility.snmp_lock
+    utility.interface_snmp.lock = utility.interface_snmp_lock
+
+    utility.get_snmp_interfaces()
+    utility.get_snmp_interfaces()
+
+    assert utility.snmp.locked == [True] * walk_count()
+    assert utility.interface_snmp.locked == [True, True]
+
+
+def test_columns_are_arrays_when_complete(utility):
+    columns = utility.get_snmp_interface_columns()
+
+    assert columns['ifName'] == ['eth1', 'eth2']
+    assert columns['ifHCInOctets'].typecode == 'Q'
+    assert list(columns['ifHCInOctets']) == [10, 20]
+
+
+def test_columns_with_missing_values_use_none(utility, monkeypatch):
+    bulkwalk = utility.snmp.bulkwalk
+
+    def sparse_bulkwalk(oid):
+        # Interface 2 does not report ifHCInOctets
+        return [field for field in bulkwalk(oid)
+                if not (field.oid_index == '2'
+                        and field.oid == 'ifHCInOctets')]
+
+    monkeypatch.setattr(utility.snmp, 'bulkwalk', sparse_bulkwalk)
+
+    columns = utility.get_snmp_interface_columns()
+
+    assert columns['ifHCInOctets'] == [10, None]
+    assert list(columns['ifHCOutOctets']) == [10, 20]
+
+
+def test_poll_many_rejects_concurrency_above_the_pool_size(utility):
+    with pytest.raises(ValueError):
+        asyncio.run(snmp_utilities.AsyncSnmpUtility.poll_many(
+            ['switch'], 'public', 2,
+            max_concurrency=snmp_utilities.MAX_CONCURRENCY + 1))
+
+
+@pytest.mark.parametrize('workers', [0, snmp_utilities.MAX_CONCURRENCY + 1])
+def test_poll_hosts_rejects_workers_outside_the_pool_size(utility, workers):
+    with pytest.raises(ValueError):
+        snmp_utilities.SnmpUtility.poll_hosts(
+            ['switch'], 'public', 2, workers=workers)
+
+
+def test_polling_holds_the_cache_lock(utility):
+    held = []
+
+    def cache_lock_held():
+        acquired = []
+
+        def try_acquire():
+            acquired.append(utility._cache_lock.acquire(blocking=False))
+
+            if acquired[0]:
+                utility._cache_lock.release()
+
+        thread = threading.Thread(target=try_acquire)
+        thread.start()
+        thread.join()
+        held.append(not acquired[0])
+
+    utility.snmp.hook = cache_lock_held
+    utility.interface_snmp.hook = cache_lock_held
+
+    utility.get_snmp_interfaces()
+    utility.get_snmp_interfaces()
+
+    assert held == [True] * (walk_count() + 2)
+
+
+def test_poll_hosts_and_poll_many_share_the_utility(utility):
+    snmp_utilities.SnmpUtility.poll_hosts(['switch'], 'public', 2)
+    walked_calls = len(utility.snmp.calls)
+    asyncio.run(snmp_utilities.AsyncSnmpUtility.poll_many(
+        ['switch'], 'public', 2))
+
+    assert utility.snmp.calls[:walked_calls] == ['bulkwalk'] * walk_count()
+    assert utility.snmp.calls[walked_calls:] == ['get', 'get']
+
+
+def test_subclass_interface_oids_are_named(utility):
+    class AliasUtility(snmp_utilities.SnmpUtility):
+        interface_oids = dict(snmp_utilities.SnmpUtility.interface_oids, **{
+            '.1.3.6.1.2.1.31.1.1.1.18': 'ifAlias'})
+
+    alias_utility = AliasUtility('switch', 'public', 2)
+    walked = alias_utility.get_snmp_interfaces()
+    cached = alias_utility.get_snmp_interfaces()
+
+    assert walked == cached
+    assert walked[0]['ifAlias'] == 10
+    assert walked[0]['ifName'] == 'eth1'
+
+
+def test_clear_session_cache_drops_sessions_and_utilities(utility):
+    snmp_utilities.clear_session_cache()
+
+    assert snmp_utilities._get_session.cache_info().currsize == 0
+    assert snmp_utilities._get_utility.cache_info().currsize == 0
+    assert snmp_utilities._get_utility(
+        snmp_utilities.SnmpUtility, 'switch', 'public', 2) is not utility
+    assert snmp_utilities.SnmpQuery(
+        'switch', 'public', 2).snmp is not utility.snmp
+
+
+def test_session_caches_stay_below_the_descriptor_limit():
+    sessions = (snmp_utilities._get_session.cache_info().maxsize
+                + 2 * snmp_utilities._get_utility.cache_info().maxsize)
+
+    assert sessions <= 512
+
+
+def test_create_builds_the_utility_off_the_event_loop(utility):
+    class RecordingUtility(snmp_utilities.SnmpUtility):
+        def __init__(self, *args, **kwargs):
+            self.thread = threading.current_thread()
+            super().__init__(*args, **kwargs)
+
+    async def create():
+        return await snmp_utilities.AsyncSnmpUtility.create(
+            'switch', 'public', 2, utility_class=RecordingUtility,
+            refresh_oids_cache_interval=60)
+
+    async_utility = asyncio.run(create())
+
+    assert isinstance(async_utility.utility, RecordingUtility)
+    assert async_utility.utility.thread is not threading.main_thread()
+    assert async_utility.utility.refresh_oids_cache_interval == 60
+    assert asyncio.run(async_utility.get_snmp_name()) == {'sysName': 'switch'}
+
+
+def test_poll_many_uses_the_utility_class(utility):
+    class AliasUtility(snmp_utilities.SnmpUtility):
+        interface_oids = dict(snmp_utilities.SnmpUtility.interface_oids, **{
+            '.1.3.6.1.2.1.31.1.1.1.18': 'ifAlias'})
+
+    results = asyncio.run(snmp_utilities.AsyncSnmpUtility.poll_many(
+        ['switch'], 'public', 2, utility_class=AliasUtility))
+
+    assert results[0][0]['ifAlias'] == 10
+
+
+@pytest.mark.parametrize('value, snmp_type, expected', [
+    ('123', 'INTEGER', 123),
+    ('99', 'COUNTER64', 99),
+    ('42', 'GAUGE', 42),
+    ('123', 'OCTETSTR', 123),
+    ('eth0', 'OCTETSTR', 'eth0'),
+])
+def test_cast_uses_the_snmp_type(utility, value, snmp_type, expected):
+    result = utility.cast(value, snmp_type)
+
+    assert result == expected
+    assert type(result) is type(expected)
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('42', 42),
+    ('-7', -7),
+    (' 42', 42),
+    ('+5', 5),
+    ('1.5', 1.5),
+    ('.5', 0.5),
+    ('1e3', 1000.0),
+    ('inf', float('inf')),
+    ('-Infinity', float('-inf')),
+    (3.7, 3),
+    ('eth0', 'eth0'),
+    ('none', 'none'),
+    ('1/1', '1/1'),
+    ('-', '-'),
+    ('', ''),
+    (None, 'None'),
+])
+def test_cast_detects_the_type(utility, value, expected):
+    result = utility.cast(value)
+
+    assert result == expected
+    assert type(result) is type(expected)
+
+
+def test_cast_parses_nan(utility):
+    assert math.isnan(utility.cast('nan'))